@@ -9,12 +9,13 @@ import os
 os.environ['PYTHONDONTWRITEBYTECODE'] = '1'
 
 import pytest
-import asyncio
+import time
 import allure
 from typing import Dict
 from playwright.async_api import Page
 from utils.playwright_factory import PlaywrightFactory
 from utils.common_methods import CommonMethods
+from utils.app_constants import AppConstants
 from utils.logger import Log
 from pages.login_page import LoginPage
 from pages.landing_page import LandingPage
@@ -22,39 +23,120 @@ from pages.home_page import HomePage
 from pages.working_screen_page import WorkingScreenPage
 from pages.working_screen_page_audit import WorkingScreenPageAudit
 
+# Login session shared by test classes that don't need a fresh login (one per xdist worker)
+AUTH_STATE_PATH = ".auth/state_{worker_id}.json"
 
-@pytest.fixture(scope="class")
-async def browser_setup(request):
+
+def _get_worker_id() -> str:
+    """Get the pytest-xdist worker id ("gw0" when not running distributed)."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+
+def _get_browser_name(request) -> str:
+    """Get browser parameter from command line or use default."""
+    browser_name = request.config.getoption("--browser", default="chrome")
+    
+    # Handle if browser_name is a list (from pytest-playwright)
+    if isinstance(browser_name, list):
+        browser_name = browser_name[0] if browser_name else "chrome"
+    
+    return browser_name
+
+
+@pytest.fixture(scope="session")
+async def session_browser(request):
     """
-    Setup browser before each test.
+    Launch one browser for the whole test session (one per xdist worker).
     
     Args:
         request: Pytest request object
     """
-    # Get browser parameter from command line or use default
-    browser_name = request.config.getoption("--browser", default="chrome")
+    browser_name = _get_browser_name(request)
+    Log.info(f"Setting up browser: {browser_name} (worker {_get_worker_id()})")
     
-    # Handle if browser_name is a list (from pytest-playwright)
-    if isinstance(browser_name, list):
-        browser_name = browser_name[0] if browser_name else "chrome"
+    browser = await PlaywrightFactory.get_or_launch_browser(browser_name)
+    
+    yield browser
+    
+    # Cleanup
+    Log.info("Closing browser")
+    await PlaywrightFactory.close_browser()
+
+
+@pytest.fixture(scope="session")
+async def auth_state(request, session_browser):
+    """
+    Log in once and save the session for reuse by test classes.
+    
+    Yields (storage state path, username of the session), or (None, None)
+    if the login could not be done.
+    
+    Args:
+        request: Pytest request object
+        session_browser: Shared session browser
+    """
+    pf = PlaywrightFactory()
+    props = pf.init_prop()
+    username = props.get("username")
+    password = props.get("password")
+    
+    if not username or not password:
+        Log.info("No username/password configured, test classes will log in themselves")
+        yield None, None
+        return
+    
+    state_path = AUTH_STATE_PATH.format(worker_id=_get_worker_id())
+    page = await pf.init_browser(props, _get_browser_name(request))
+    try:
+        logged_in = await LoginPage(page).login_with_mfa(username, password, props)
+        if logged_in:
+            os.makedirs(os.path.dirname(state_path), exist_ok=True)
+            await page.context.storage_state(path=state_path)
+            Log.info(f"Login session saved: {state_path}")
+        else:
+            Log.error("Shared login failed, test classes will log in themselves")
+    finally:
+        await page.context.close()
+    
+    yield (state_path, username) if logged_in else (None, None)
+
+
+@pytest.fixture(scope="class")
+async def browser_setup(request, session_browser, auth_state):
+    """
+    Open a fresh browser context and page for each test class.
     
-    Log.info(f"Setting up browser: {browser_name}")
+    The context starts from the shared login session unless the class
+    is marked with @pytest.mark.fresh_login. Classes that call logout() must
+    use the marker, since logging out ends the shared server-side session
+    for every later class on this worker.
     
+    Args:
+        request: Pytest request object
+        session_browser: Shared session browser
+        auth_state: Shared login session file and its username (or None, None)
+    """
     # Initialize PlaywrightFactory
     pf = PlaywrightFactory()
     props = pf.init_prop()
-    page = await pf.init_browser(props, browser_name)
+    
+    storage_state = None
+    if request.node.get_closest_marker("fresh_login") is None:
+        storage_state, auth_username = auth_state
+        if storage_state:
+            # Lets login_with_mfa accept the session only for the same user
+            props["auth_username"] = auth_username
+    page = await pf.init_browser(props, _get_browser_name(request), storage_state)
     
     # Ensure page is fully ready
     await page.wait_for_load_state("domcontentloaded")
-    await page.wait_for_timeout(500)
     Log.info(f"Page ready, URL: {page.url}")
     
     yield {"page": page, "props": props, "factory": pf}
     
     # Cleanup
-    Log.info("Closing browser")
-    await PlaywrightFactory.close_browser()
+    Log.info("Closing browser context")
+    await page.context.close()
 
 
 @pytest.fixture(scope="class")
@@ -112,11 +194,6 @@ async def setup_pages(request, page, config, login_page, landing_page, home_page
     Automatically inject all page objects into test class instance.
     This allows tests to use self.landing_page instead of passing fixtures.
     """
-    # Clear cached locators to ensure fresh load
-    CommonMethods._locators.clear()
-    CommonMethods._loaded_files.clear()
-    Log.info("Cleared locator cache for new test class")
-    
     # Store all page objects and config as class attributes
     request.cls.page = page
     request.cls.config = config
@@ -130,6 +207,40 @@ async def setup_pages(request, page, config, login_page, landing_page, home_page
     yield
 
 
+@pytest.fixture(autouse=True)
+async def screenshot_on_failure(request, page):
+    """Capture screenshot on test failure."""
+    yield
+    
+    rep = getattr(request.node, "rep_call", None)
+    if rep is None or not rep.failed:
+        return
+    
+    try:
+        # Awaited on the same event loop the page belongs to; kept in memory
+        data = await page.screenshot(full_page=True, type="jpeg", quality=60)
+        
+        # Write to disk only when requested
+        if os.environ.get("SAVE_SCREENSHOTS_TO_DISK", "").lower() in ("1", "true", "yes"):
+            os.makedirs("reports/screenshots", exist_ok=True)
+            screenshot_path = f"reports/screenshots/failure_{time.monotonic_ns()}.jpg"
+            with open(screenshot_path, "wb") as image_file:
+                image_file.write(data)
+            Log.info(f"Screenshot saved: {screenshot_path}")
+        
+        # Attach to allure if available
+        try:
+            allure.attach(
+                data,
+                name="Screenshot on Failure",
+                attachment_type=allure.attachment_type.JPG
+            )
+        except Exception as e:
+            Log.error(f"Error attaching screenshot to allure: {e}")
+    except Exception as e:
+        Log.error(f"Error taking screenshot on failure: {e}")
+
+
 # Removed this for solving an issue in runtime.
 # def pytest_addoption(parser):
 #     """Add custom command line options."""
@@ -143,48 +254,10 @@ async def setup_pages(request, page, config, login_page, landing_page, home_page
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Capture screenshot on test failure."""
+    """Store each phase report on the test item for fixtures to inspect."""
     outcome = yield
     rep = outcome.get_result()
-    
-    if rep.when == "call" and rep.failed:
-        try:
-            # Get page from fixture if available
-            if "page" in item.funcargs:
-                page = item.funcargs["page"]
-                
-                # Create reports directory if it doesn't exist
-                import os
-                if not os.path.exists("reports/screenshots"):
-                    os.makedirs("reports/screenshots")
-                
-                # Take screenshot with timestamp
-                import time
-                timestamp = int(time.time() * 1000)
-                screenshot_path = f"reports/screenshots/failure_{timestamp}.png"
-                
-                # Take screenshot using the page object directly
-                asyncio.get_event_loop().run_until_complete(
-                    page.screenshot(path=screenshot_path, full_page=True)
-                )
-                
-                Log.info(f"Screenshot saved: {screenshot_path}")
-                
-                # Attach to allure if available
-                try:
-                    import allure
-                    with open(screenshot_path, "rb") as image_file:
-                        allure.attach(
-                            image_file.read(),
-                            name="Screenshot on Failure",
-                            attachment_type=allure.attachment_type.PNG
-                        )
-                except ImportError:
-                    pass  # Allure not available
-                except Exception as e:
-                    Log.error(f"Error attaching screenshot to allure: {e}")
-        except Exception as e:
-            Log.error(f"Error taking screenshot on failure: {e}")
+    setattr(item, f"rep_{rep.when}", rep)
 
 
 @pytest.hookimpl(tryfirst=True)
@@ -193,4 +266,19 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "order: specify test execution order"
     )
+    
+    # Never pause xdist workers in the Playwright inspector
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        os.environ["PWDEBUG"] = "0"
+    
+    # Preload every object repository CSV once for the whole session
+    csv_files = [
+        value for name, value in vars(AppConstants).items()
+        if name.endswith("_ELEMENTS") and isinstance(value, str) and value.endswith(".csv")
+    ]
+    CommonMethods.preload_all(csv_files)
+
 
+def pytest_sessionfinish(session, exitstatus):
+    """Write locators updated during the run back to their CSV files."""
+    CommonMethods.flush()
@@ -1,17 +1,72 @@
 """Common utility methods for the framework."""
+import asyncio
 import csv
 import os
-from pathlib import Path
-from typing import Dict, Optional
+import pickle
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from jproperties import Properties
 from playwright.async_api import Page
 import pyotp
 from utils.logger import Log
+from utils.app_constants import AppConstants
+
+try:
+    import allure as _allure
+except ImportError:
+    _allure = None  # Allure not available, attachments are skipped
+
+
+# Date shapes understood by normalize_date, each with its candidate formats
+_DATE_PATTERNS = [
+    (re.compile(r"^[A-Za-z]{3,9}\s+\d{1,2},\s+\d{4}$"), ("%b %d, %Y", "%B %d, %Y")),  # Jun 28, 1953
+    (re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$"), ("%m/%d/%Y", "%d/%m/%Y")),         # 6/28/1953
+    (re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$"), ("%Y-%m-%d",)),                    # 1953-06-28
+]
+
+
+# TOTP time step in seconds (pyotp default)
+_TOTP_INTERVAL = 30
+
+
+@lru_cache(maxsize=None)
+def _get_totp(secret: str) -> pyotp.TOTP:
+    """Get the TOTP generator for a secret, decoded once per secret."""
+    return pyotp.TOTP(secret, interval=_TOTP_INTERVAL)
+
+
+@lru_cache(maxsize=64)
+def _totp_cached(secret: str, window: int) -> str:
+    """Get the TOTP code of a secret for one time window."""
+    return _get_totp(secret).at(window * _TOTP_INTERVAL)
 
 
 class AllureHelper:
     """Helper class for Allure reporting."""
     
+    @staticmethod
+    def attach(message: str, name: str = "Test Info"):
+        """
+        Attach text information to the Allure report of the running test.
+        
+        Skipped when Allure is not installed or no test is running.
+        
+        Args:
+            message: The message to attach
+            name: The attachment name (default: "Test Info")
+        """
+        if _allure is None or os.environ.get("PYTEST_CURRENT_TEST") is None:
+            return
+        _allure.attach(
+            message,
+            name=name,
+            attachment_type=_allure.attachment_type.TEXT
+        )
+    
     @staticmethod
     def before(message: str, name: str = "Test Info"):
         """
@@ -21,15 +76,7 @@ class AllureHelper:
             message: The message to attach
             name: The attachment name (default: "Test Info")
         """
-        try:
-            import allure
-            allure.attach(
-                message,
-                name=name,
-                attachment_type=allure.attachment_type.TEXT
-            )
-        except ImportError:
-            pass  # Allure not available, skip
+        AllureHelper.attach(message, name)
     
     @staticmethod
     def after(message: str):
@@ -39,7 +86,7 @@ class AllureHelper:
         Args:
             message: The result message to attach
         """
-        allure.before(message, name="Test Result")
+        AllureHelper.attach(message, name="Test Result")
 
 
 # Alias for consistent usage across the framework
@@ -50,9 +97,10 @@ class CommonMethods:
     """Common methods for framework operations."""
 
     _page: Optional[Page] = None
-    _props: Optional[Properties] = None
-    _locators: Dict[str, str] = {}
-    _loaded_files: set = set()
+    _props: Optional[Dict[str, str]] = None
+    _locators: Dict[str, Dict[str, str]] = {}
+    _dirty_keys: Dict[str, set] = {}
+    _reports_ready: bool = False
 
     def __init__(self, page: Page):
         """Initialize with page instance."""
@@ -67,10 +115,12 @@ class CommonMethods:
         Returns:
             str: Path to the screenshot file
         """
-        if not os.path.exists("reports"):
-            os.makedirs("reports")
+        timestamp = time.monotonic_ns()
+        
+        if not CommonMethods._reports_ready:
+            os.makedirs("reports", exist_ok=True)
+            CommonMethods._reports_ready = True
         
-        timestamp = int(Path(os.getcwd()).stat().st_mtime * 1000)
         screenshot_path = f"reports/{timestamp}.png"
         
         try:
@@ -85,13 +135,32 @@ class CommonMethods:
         """
         Initialize properties from config file.
         
+        The parsed properties are pickled to .cache/ and reused while the
+        config file is unchanged.
+        
         Returns:
-            Dict[str, str]: Properties dictionary
+            Dict[str, str]: Properties dictionary (a copy, safe to modify)
         """
+        if CommonMethods._props is not None:
+            return dict(CommonMethods._props)
+        
         config_path = "./configs/config.properties"
-        props = Properties()
+        cache_path = "./.cache/config.properties.pkl"
         
         try:
+            mtime = os.stat(config_path).st_mtime_ns
+            
+            # Reuse the cached properties if the config file hasn't changed
+            try:
+                with open(cache_path, 'rb') as cache_file:
+                    cached_mtime, props_dict = pickle.load(cache_file)
+                if cached_mtime == mtime:
+                    CommonMethods._props = props_dict
+                    return dict(props_dict)
+            except Exception:
+                pass  # Missing or unreadable cache, parse the config file
+            
+            props = Properties()
             with open(config_path, 'rb') as config_file:
                 props.load(config_file)
             
@@ -100,8 +169,15 @@ class CommonMethods:
             for key, value in props.items():
                 props_dict[key] = value.data
             
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(cache_path, 'wb') as cache_file:
+                    pickle.dump((mtime, props_dict), cache_file)
+            except OSError as e:
+                Log.error(f"Error caching properties: {e}")
+            
             CommonMethods._props = props_dict
-            return props_dict
+            return dict(props_dict)
         except FileNotFoundError:
             Log.error(f"Config file not found: {config_path}")
             return {}
@@ -121,41 +197,104 @@ class CommonMethods:
         Returns:
             str: Locator value or None
         """
-        locator = None
+        locators = CommonMethods._get_locators(file_name)
         
-        if file_name in CommonMethods._loaded_files:
-            Log.info(f"Locators already loaded for {file_name}")
-        else:
-            CommonMethods._locators.update(CommonMethods._load_csv(file_name))
-            CommonMethods._loaded_files.add(file_name)
-        
-        if element_name in CommonMethods._locators:
-            locator = CommonMethods._locators[element_name]
-        else:
+        locator = locators.get(element_name)
+        if locator is None:
             Log.info(f"Element '{element_name}' not found in the file.")
-            Log.info(f"Available keys in _locators: {list(CommonMethods._locators.keys())[:10]}")
+            Log.info(f"Available keys in {file_name}: {list(locators.keys())[:10]}")
         
         return locator
 
+    @staticmethod
+    def get_many_from_csv(element_names: Tuple[str, ...], file_name: str) -> Tuple[Optional[str], ...]:
+        """
+        Retrieve several values from the same CSV file.
+        
+        Args:
+            element_names: Names of the elements
+            file_name: Name of the CSV file
+            
+        Returns:
+            Tuple[Optional[str], ...]: Locator values (None where missing), in the given order
+        """
+        locators = CommonMethods._get_locators(file_name)
+        return tuple(locators.get(element_name) for element_name in element_names)
+
+    @staticmethod
+    def _get_locators(file_name: str) -> Dict[str, str]:
+        """
+        Get the cached locators of a CSV file, loading it on first use.
+        
+        Args:
+            file_name: Name of the CSV file
+            
+        Returns:
+            Dict[str, str]: Dictionary of locators
+        """
+        locators = CommonMethods._locators.get(file_name)
+        if locators is None:
+            locators = CommonMethods._locators.setdefault(
+                file_name, CommonMethods._load_csv(file_name)
+            )
+        return locators
+
+    @staticmethod
+    def preload_all(files: List[str]):
+        """
+        Load several CSV files into the locator cache in parallel.
+        
+        Args:
+            files: Names of the CSV files
+        """
+        pending = [f for f in files if f not in CommonMethods._locators]
+        if not pending:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            for file_name, locators in zip(pending, executor.map(CommonMethods._load_csv, pending)):
+                CommonMethods._locators.setdefault(file_name, locators)
+        
+        Log.debug(f"Preloaded locators for {len(pending)} file(s)")
+
     @staticmethod
     def update_locator(element_name: str, locator: str, file_name: str):
         """
         Update or add a locator.
         
+        The change is kept in memory and written to the CSV file by flush().
+        
         Args:
             element_name: Name of the element
             locator: Locator value
             file_name: Name of the CSV file
         """
-        CommonMethods._locators = CommonMethods._load_csv(file_name)
+        locators = CommonMethods._get_locators(file_name)
         
-        if element_name in CommonMethods._locators:
+        if element_name in locators:
             Log.info(f"Updating locator for element: {element_name}")
         else:
             Log.info(f"Adding new element: {element_name}")
         
-        CommonMethods._locators[element_name] = locator
-        CommonMethods._save_locators(CommonMethods._locators, file_name)
+        locators[element_name] = locator
+        CommonMethods._dirty_keys.setdefault(file_name, set()).add(element_name)
+
+    @staticmethod
+    def flush():
+        """
+        Write updated locators back to their CSV files.
+        
+        Each file is re-read from disk and only the locators updated by this
+        process are applied, so updates written by other workers are kept.
+        """
+        for file_name, element_names in sorted(CommonMethods._dirty_keys.items()):
+            cached = CommonMethods._locators[file_name]
+            # Bypass the lru_cache to get the current file content
+            locators = CommonMethods._load_csv.__wrapped__(file_name)
+            for element_name in sorted(element_names):
+                locators[element_name] = cached[element_name]
+            CommonMethods._save_locators(locators, file_name)
+        CommonMethods._dirty_keys.clear()
 
     @staticmethod
     def _save_locators(locators: Dict[str, str], file_name: str):
@@ -181,9 +320,10 @@ class CommonMethods:
             Log.error(f"Error writing to the file: {e}")
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _load_csv(file_name: str) -> Dict[str, str]:
         """
-        Load CSV file.
+        Load CSV file (parsed once per process and cached by file name).
         
         Args:
             file_name: Name of the CSV file
@@ -196,19 +336,22 @@ class CommonMethods:
         
         try:
             with open(csv_file, 'r', encoding='utf-8') as file:
-                csv_reader = csv.DictReader(file)
+                csv_reader = csv.reader(file)
+                next(csv_reader, None)  # Skip "Element Name,Locator" header
                 
                 for row in csv_reader:
-                    key = row.get("Element Name", "").strip()
-                    value = row.get("Locator", "").strip()
+                    if len(row) < 2:
+                        continue
+                    key = row[0].strip()
+                    value = row[1].strip()
                     
                     if key and value:
                         # Always add/update locators from CSV
                         locators[key] = value
             
-            Log.info(f"Locators loaded successfully. Loaded {len(locators)} locators from {file_name}")
+            Log.debug(f"Locators loaded successfully. Loaded {len(locators)} locators from {file_name}")
             if locators:
-                Log.info(f"Sample locator keys: {list(locators.keys())[:5]}")
+                Log.debug(f"Sample locator keys: {list(locators.keys())[:5]}")
         except FileNotFoundError:
             Log.error(f"CSV file not found: {csv_file}")
         except Exception as e:
@@ -228,8 +371,7 @@ class CommonMethods:
             str: 6-digit TOTP code
         """
         try:
-            totp = pyotp.TOTP(secret)
-            code = totp.now()
+            code = _totp_cached(secret, int(time.time() // _TOTP_INTERVAL))
             Log.info(f"Generated TOTP code: {code}")
             return code
         except Exception as e:
@@ -254,9 +396,10 @@ class CommonMethods:
         Raises:
             AssertionError: If text doesn't match
         """
-        locator = CommonMethods.get_values_from_csv(csv_key, csv_file)
-        await page.wait_for_selector(locator, timeout=timeout)
-        actual = (await page.text_content(locator)).strip()
+        # One locator object for both the wait and the read (first match, like page.text_content)
+        element = page.locator(CommonMethods.get_values_from_csv(csv_key, csv_file)).first
+        await element.wait_for(timeout=timeout)
+        actual = (await element.text_content()).strip()
         actual = actual.replace('\u00a0', ' ')  # Clean non-breaking spaces
         
         Log.info(f"Validating {csv_key}: expected='{expected}', actual='{actual}'")
@@ -282,15 +425,17 @@ class CommonMethods:
         Raises:
             AssertionError: If title or message doesn't match
         """
+        title_locator, msg_locator = CommonMethods.get_many_from_csv(
+            ("lbl_DialogTitle", "lbl_DialogText"), csv_file
+        )
+        
         # Validate title
-        title_locator = CommonMethods.get_values_from_csv("lbl_DialogTitle", csv_file)
         await page.wait_for_selector(title_locator, timeout=timeout)
-        actual_title = (await page.text_content(title_locator)).strip()
+        actual_title = (await page.locator(title_locator).first.text_content()).strip()
         assert actual_title == expected_title, f"Popup title mismatch: expected '{expected_title}', got '{actual_title}'"
         
-        # Validate message
-        msg_locator = CommonMethods.get_values_from_csv("lbl_DialogText", csv_file)
-        actual_msg = (await page.text_content(msg_locator)).strip()
+        # Validate message (locator reads auto-wait for the element)
+        actual_msg = (await page.locator(msg_locator).first.text_content()).strip()
         assert actual_msg == expected_message, f"Popup message mismatch: expected '{expected_message}', got '{actual_msg}'"
         
         Log.info(f"✓ Popup validated: '{actual_title}' - '{actual_msg}'")
@@ -317,15 +462,15 @@ class CommonMethods:
         """
         locator = CommonMethods.get_values_from_csv(csv_key, csv_file)
         await page.wait_for_selector(locator, timeout=timeout)
-        elements = page.locator(locator)
-        count = await elements.count()
+        actuals = [text.strip() for text in await page.locator(locator).all_text_contents()]
+        count = len(actuals)
         
         assert count == len(expected_options), f"Option count mismatch: expected {len(expected_options)}, got {count}"
         
-        for i in range(count):
-            actual = (await elements.nth(i).text_content()).strip()
-            expected = expected_options[i]
-            assert actual == expected, f"Option {i} mismatch: expected '{expected}', got '{actual}'"
+        if actuals != list(expected_options):
+            # Report the first differing option
+            for i, (actual, expected) in enumerate(zip(actuals, expected_options)):
+                assert actual == expected, f"Option {i} mismatch: expected '{expected}', got '{actual}'"
         
         Log.info(f"✓ Validated {count} options for {csv_key}")
         allure.after(f"✓ List options validated: {csv_key}")
@@ -348,8 +493,15 @@ class CommonMethods:
         Raises:
             AssertionError: If any field doesn't match
         """
-        for csv_key, expected in fields.items():
-            await CommonMethods.validate_text(page, csv_key, expected, csv_file, timeout)
+        results = await asyncio.gather(*[
+            CommonMethods.validate_text(page, csv_key, expected, csv_file, timeout)
+            for csv_key, expected in fields.items()
+        ], return_exceptions=True)
+        
+        # Report the first failing field in fields order
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         
         Log.info(f"✓ Validated {len(fields)} fields")
         return True
@@ -372,8 +524,6 @@ class CommonMethods:
             Removed role-based selection as search lists are now unified.
             Legacy role-based logic commented below for reference.
         """
-        from utils.app_constants import AppConstants
-        
         # Legacy role-based selection (kept for reference - not used in new UI)
         # if role.lower() == "auditor":
         #     expected_options = AppConstants.SEARCH_LIST_AUDITOR
@@ -388,6 +538,7 @@ class CommonMethods:
         return await CommonMethods.validate_list_options(page, "lst_SearchList", expected_options, csv_file, timeout)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_date(date_str: str) -> str:
         """
         Normalize date string to a common format for comparison.
@@ -400,28 +551,21 @@ class CommonMethods:
             str: Normalized date in MM/DD/YYYY format
             
         Examples:
-            "Jun 28, 1953" -> "6/28/1953"
-            "6/28/1953" -> "6/28/1953"
-            "1953-06-28" -> "6/28/1953"
-        """
-        from datetime import datetime
-        
-        # Common date formats
-        date_formats = [
-            "%b %d, %Y",      # Jun 28, 1953
-            "%B %d, %Y",      # June 28, 1953
-            "%m/%d/%Y",       # 6/28/1953
-            "%Y-%m-%d",       # 1953-06-28
-            "%d/%m/%Y",       # 28/06/1953
-        ]
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str.strip(), fmt)
-                return parsed_date.strftime("%m/%d/%Y")
-            except ValueError:
-                continue
+            "Jun 28, 1953" -> "06/28/1953"
+            "6/28/1953" -> "06/28/1953"
+            "1953-06-28" -> "06/28/1953"
+        """
+        value = date_str.strip()
+        
+        # Only try the formats matching the shape of the date
+        for pattern, date_formats in _DATE_PATTERNS:
+            if pattern.match(value):
+                for fmt in date_formats:
+                    try:
+                        return datetime.strptime(value, fmt).strftime("%m/%d/%Y")
+                    except ValueError:
+                        continue
+                break
         
         # If no format matched, return original
-        return date_str.strip()
-
+        return value
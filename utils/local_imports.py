@@ -15,6 +15,7 @@ This provides:
 import pytest
 import asyncio
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Any, Tuple
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
@@ -25,6 +26,15 @@ from utils.openai_utils import OpenAIUtils
 from utils.app_constants import AppConstants
 
 
+_ASYNCIO_MARK = pytest.mark.asyncio
+
+
+@lru_cache(maxsize=None)
+def _order_mark(order):
+    """Get the pytest order marker for an order number, built once per number."""
+    return pytest.mark.order(order)
+
+
 def step(order):
     """
     Shorthand decorator for ordered async tests.
@@ -38,10 +48,10 @@ def step(order):
     Args:
         order: The execution order number for the test
     """
+    order_mark = _order_mark(order)
+
     def decorator(func):
-        func = pytest.mark.order(order)(func)
-        func = pytest.mark.asyncio(func)
-        return func
+        return _ASYNCIO_MARK(order_mark(func))
     return decorator
 
 
@@ -1,13 +1,35 @@
 """Logging utility module."""
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 
 
+class _EncodedFileHandler(logging.FileHandler):
+    """File handler that encodes each record once and writes bytes to the file buffer."""
+
+    def emit(self, record: logging.LogRecord):
+        """Write the record, flushing only for errors (Log flushes the rest periodically)."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            buffer = self.stream.buffer
+            buffer.write((self.format(record) + self.terminator).encode(self.encoding))
+            if record.levelno >= logging.ERROR:
+                buffer.flush()
+        except Exception:
+            self.handleError(record)
+
+
 class Log:
     """Logger class for the automation framework."""
 
     _logger = None
+    _listener = None
 
     @classmethod
     def _get_logger(cls):
@@ -26,7 +48,7 @@ class Log:
 
             # File handler
             log_file = f"logs/test_execution.log"
-            file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+            file_handler = _EncodedFileHandler(log_file, mode='a', encoding='utf-8', delay=True)
             file_handler.setLevel(logging.INFO)
 
             # Formatter
@@ -37,29 +59,50 @@ class Log:
             console_handler.setFormatter(formatter)
             file_handler.setFormatter(formatter)
 
+            # Batch file writes in memory, flushed on errors, when full and every second
+            buffer_handler = logging.handlers.MemoryHandler(
+                capacity=512, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+            )
+            buffer_handler.setLevel(logging.INFO)
+            atexit.register(buffer_handler.close)
+            threading.Thread(
+                target=cls._flush_periodically, args=(buffer_handler,), name="LogFlusher", daemon=True
+            ).start()
+
+            # Write records from a background thread so logging never blocks the event loop
+            log_queue = queue.SimpleQueue()
+            cls._listener = logging.handlers.QueueListener(
+                log_queue, console_handler, buffer_handler, respect_handler_level=True
+            )
+            cls._listener.start()
+            atexit.register(cls._listener.stop)
+
             # Add handlers
-            cls._logger.addHandler(console_handler)
-            cls._logger.addHandler(file_handler)
+            cls._logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
         return cls._logger
 
     @classmethod
-    def info(cls, message: str):
-        """Log info message."""
-        cls._get_logger().info(message)
+    def _flush_periodically(cls, handler: logging.handlers.MemoryHandler, interval: float = 1.0):
+        """Flush a buffering handler and its target every interval seconds."""
+        while True:
+            time.sleep(interval)
+            handler.flush()
+            # Read once: MemoryHandler.close() clears target at shutdown
+            target = handler.target
+            if target is not None:
+                target.flush()
 
     @classmethod
-    def error(cls, message: str):
-        """Log error message."""
-        cls._get_logger().error(message)
+    def is_info_enabled(cls) -> bool:
+        """Check if info messages are logged (guard for costly message building)."""
+        return cls._get_logger().isEnabledFor(logging.INFO)
 
-    @classmethod
-    def warn(cls, message: str):
-        """Log warning message."""
-        cls._get_logger().warning(message)
-
-    @classmethod
-    def debug(cls, message: str):
-        """Log debug message."""
-        cls._get_logger().debug(message)
 
+# Configure the logger once at import and expose its methods directly, so
+# Log.info/error/warn/debug(message, *args, **kwargs) skip the setup check
+_logger = Log._get_logger()
+Log.info = _logger.info
+Log.error = _logger.error
+Log.warn = _logger.warning
+Log.debug = _logger.debug
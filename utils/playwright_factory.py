@@ -1,7 +1,11 @@
 """Playwright factory for browser management."""
+import asyncio
 import os
+import time
 from contextvars import ContextVar
-from typing import Dict, Optional
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import aiofiles
 from playwright.async_api import (
     Browser,
     BrowserContext,
@@ -12,16 +16,43 @@ from playwright.async_api import (
 from utils.logger import Log
 from utils.common_methods import CommonMethods
 
+SCREENSHOTS_DIR = "Screenshots"
+os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+
+# Browser name -> (Playwright engine, launch options)
+_BROWSER_LAUNCHERS = {
+    "chromium": ("chromium", {"headless": False}),
+    "firefox": ("firefox", {"headless": False}),
+    "safari": ("webkit", {"headless": False}),
+    "webkit": ("webkit", {"headless": False}),
+    "chrome": ("chromium", {
+        "channel": "chrome",
+        "headless": False,
+        "args": ['--start-maximized']  # Start Chrome in maximized mode
+    }),
+}
+
+
+@dataclass
+class _BrowserSession:
+    """Playwright handles of the current test class."""
+
+    playwright: Playwright
+    browser: Browser
+    context: BrowserContext
+    page: Page
+
 
 class PlaywrightFactory:
     """Factory class for Playwright browser management."""
 
-    # Context variables for async support
-    _playwright_context: ContextVar[Optional[Playwright]] = ContextVar('playwright', default=None)
-    _browser_context: ContextVar[Optional[Browser]] = ContextVar('browser', default=None)
-    _context_context: ContextVar[Optional[BrowserContext]] = ContextVar('context', default=None)
-    _page_context: ContextVar[Optional[Page]] = ContextVar('page', default=None)
+    # Context variable for async support
+    _session: ContextVar[Optional[_BrowserSession]] = ContextVar('session', default=None)
     _playwright_manager = None
+    _init_lock: Optional[asyncio.Lock] = None
+    _shared_browser: Optional[Browser] = None
+    # (storage_state, task) of a context being created ahead of the next init_browser call
+    _prewarmed_context: Optional[Tuple[Optional[str], asyncio.Task]] = None
 
     def __init__(self):
         """Initialize the factory."""
@@ -30,70 +61,91 @@ class PlaywrightFactory:
     @classmethod
     def get_playwright(cls) -> Optional[Playwright]:
         """Get the Playwright instance."""
-        return cls._playwright_context.get()
+        session = cls._session.get()
+        return session.playwright if session else None
 
     @classmethod
     def get_browser(cls) -> Optional[Browser]:
         """Get the Browser instance."""
-        return cls._browser_context.get()
+        session = cls._session.get()
+        return session.browser if session else None
 
     @classmethod
     def get_browser_context(cls) -> Optional[BrowserContext]:
         """Get the BrowserContext instance."""
-        return cls._context_context.get()
+        session = cls._session.get()
+        return session.context if session else None
 
     @classmethod
     def get_page(cls) -> Optional[Page]:
         """Get the Page instance."""
-        return cls._page_context.get()
+        session = cls._session.get()
+        return session.page if session else None
 
-    async def init_browser(self, props: Dict[str, str], browser_name: str) -> Page:
+    @classmethod
+    def _get_init_lock(cls) -> asyncio.Lock:
+        """Get the browser startup lock, created on first use inside the event loop."""
+        if cls._init_lock is None:
+            cls._init_lock = asyncio.Lock()
+        return cls._init_lock
+
+    @classmethod
+    async def get_or_launch_browser(cls, browser_name: str) -> Browser:
         """
-        Initialize the browser.
+        Get the session browser, launching it on first use.
         
         Args:
-            props: Properties dictionary
             browser_name: Name of the browser to launch
             
         Returns:
-            Page: The initialized page
+            Browser: The shared browser instance
         """
-        Log.info(f"Browser Name is:: {browser_name}")
+        # Serialize first-time startup so concurrent callers can't start Playwright twice
+        async with cls._get_init_lock():
+            if cls._shared_browser is None:
+                Log.info(f"Browser Name is:: {browser_name}")
+
+                # Start Playwright
+                if cls._playwright_manager is None:
+                    cls._playwright_manager = await async_playwright().start()
+            
+                playwright = cls._playwright_manager
+
+                # Launch browser based on browser_name
+                try:
+                    engine, launch_options = _BROWSER_LAUNCHERS[browser_name.lower()]
+                except KeyError:
+                    Log.error("Browser name is invalid....")
+                    raise ValueError(f"Invalid browser name: {browser_name}") from None
+            
+                browser = await getattr(playwright, engine).launch(**launch_options)
 
-        # Start Playwright
-        if self._playwright_manager is None:
-            self._playwright_manager = await async_playwright().start()
-        
-        playwright = self._playwright_manager
-        self._playwright_context.set(playwright)
+                cls._shared_browser = browser
+                cls._prewarm_context(browser)
 
-        # Launch browser based on browser_name
-        browser_name_lower = browser_name.lower()
-        
-        if browser_name_lower == "chromium":
-            browser = await playwright.chromium.launch(headless=False)
-        elif browser_name_lower == "firefox":
-            browser = await playwright.firefox.launch(headless=False)
-        elif browser_name_lower == "safari" or browser_name_lower == "webkit":
-            browser = await playwright.webkit.launch(headless=False)
-        elif browser_name_lower == "chrome":
-            browser = await playwright.chromium.launch(
-                channel="chrome",
-                headless=False,
-                args=['--start-maximized']  # Start Chrome in maximized mode
-            )
-        else:
-            Log.error("Browser name is invalid....")
-            raise ValueError(f"Invalid browser name: {browser_name}")
-
-        self._browser_context.set(browser)
+        return cls._shared_browser
 
-        # Create browser context with no viewport (uses full available space)
-        context = await browser.new_context(no_viewport=True)
-        self._context_context.set(context)
+    async def init_browser(self, props: Dict[str, str], browser_name: str,
+                           storage_state: Optional[str] = None) -> Page:
+        """
+        Open a new context and page on the shared browser.
+        
+        Args:
+            props: Properties dictionary
+            browser_name: Name of the browser to launch
+            storage_state: Saved login session file to start from (optional)
+            
+        Returns:
+            Page: The initialized page
+        """
+        browser = await self.get_or_launch_browser(browser_name)
 
+        context = await self._take_context(browser, storage_state)
         page = await context.new_page()
-        self._page_context.set(page)
+        self._session.set(_BrowserSession(self._playwright_manager, browser, context, page))
+
+        # Create the next test class's context while this page navigates
+        self._prewarm_context(browser, storage_state)
 
         # Navigate to URL
         url = props.get("url", "").strip()
@@ -103,6 +155,31 @@ class PlaywrightFactory:
 
         return page
 
+    @classmethod
+    def _prewarm_context(cls, browser: Browser, storage_state: Optional[str] = None):
+        """Start creating a browser context in the background for the next init_browser call."""
+        # Create browser context with no viewport (uses full available space)
+        task = asyncio.create_task(
+            browser.new_context(no_viewport=True, storage_state=storage_state)
+        )
+        cls._prewarmed_context = (storage_state, task)
+
+    @classmethod
+    async def _take_context(cls, browser: Browser, storage_state: Optional[str]) -> BrowserContext:
+        """Get the prewarmed context if it matches, otherwise create a new one."""
+        prewarmed, cls._prewarmed_context = cls._prewarmed_context, None
+        if prewarmed is not None:
+            prewarmed_state, task = prewarmed
+            try:
+                context = await task
+                if prewarmed_state == storage_state:
+                    return context
+                await context.close()
+            except Exception as e:
+                Log.error(f"Error creating prewarmed context: {e}")
+        
+        return await browser.new_context(no_viewport=True, storage_state=storage_state)
+
     def init_prop(self) -> Dict[str, str]:
         """
         Initialize properties from config file.
@@ -123,36 +200,31 @@ class PlaywrightFactory:
         """
         page = cls.get_page()
         
-        if not os.path.exists("Screenshots"):
-            os.makedirs("Screenshots")
+        timestamp = time.monotonic_ns() // 1_000_000
+        screenshot_path = f"{SCREENSHOTS_DIR}/{timestamp}.png"
         
-        import time
-        timestamp = int(time.time() * 1000)
-        screenshot_path = f"Screenshots/{timestamp}.png"
-        
-        await page.screenshot(path=screenshot_path, full_page=True)
+        # Write the image from the thread pool instead of the event loop
+        data = await page.screenshot(full_page=True)
+        async with aiofiles.open(screenshot_path, "wb") as screenshot_file:
+            await screenshot_file.write(data)
         
         return screenshot_path
 
     @classmethod
     async def close_browser(cls):
-        """Close the browser and cleanup."""
+        """Close the shared browser and cleanup."""
         try:
-            page = cls.get_page()
-            if page:
-                await page.close()
-            
-            context = cls.get_browser_context()
-            if context:
-                await context.close()
+            if cls._prewarmed_context:
+                _, task = cls._prewarmed_context
+                cls._prewarmed_context = None
+                await asyncio.gather(task, return_exceptions=True)
             
-            browser = cls.get_browser()
-            if browser:
-                await browser.close()
+            if cls._shared_browser:
+                await cls._shared_browser.close()
+                cls._shared_browser = None
             
             if cls._playwright_manager:
                 await cls._playwright_manager.stop()
                 cls._playwright_manager = None
         except Exception as e:
             Log.error(f"Error closing browser: {e}")
-